@@ -5,17 +5,28 @@ Main entry for program.
 # SPDX-FileCopyrightText: © 2024 Stacey Adams <stacey.belle.rose@gmail.com>
 # SPDX-License-Identifier: MIT
 
+from __future__ import annotations
+
 import logging
+import os
+import select
 import signal
 import sys
-import time
+from contextlib import suppress
+from typing import TYPE_CHECKING
 
 from requests.exceptions import RequestException
 from spotipy.exceptions import SpotifyException
 
-from lcd_spotify import LcdSpotify
+from lcd_spotify import ERROR_RETRY_SECONDS, LcdSpotify
 from log_handling import LogFilter, LogFormatter
 
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+# Signal dispatch table, populated once by init_signals()
+_SIG_DISPATCH: dict[int, Callable[[], None]] = {}
+
 
 def clear_lcd_and_exit() -> None:
     """Clear the LCD and exit the program."""
@@ -27,19 +38,11 @@ def signal_handler(*args) -> None:
     """Handle various signals."""
     signum = args[0]
     logger.info("Handling signal %s (%s)", signum, signal.Signals(signum).name)
-    sig_options = {
-        signal.SIGUSR1: lcd_spotify.lcd.toggle_backlight,
-        signal.SIGUSR2: lcd_spotify.spotify_manager.toggle_track_liked,
-        signal.SIGIO: lcd_spotify.reset_countdown,
-        signal.SIGALRM: lcd_spotify.spotify_manager.next_track,
-        signal.SIGHUP: clear_lcd_and_exit,
-        signal.SIGINT: clear_lcd_and_exit,
-        signal.SIGTERM: clear_lcd_and_exit,
-    }
-    try:
-        sig_options[signum]()  # use dict to simulate switch
-    except IndexError:
+    handler = _SIG_DISPATCH.get(signum)  # use dict to simulate switch
+    if handler is None:
         logger.warning("Unknown signal received.")
+        return
+    handler()
 
 
 def init_logger(lgr: logging.Logger) -> None:
@@ -57,13 +60,46 @@ def init_logger(lgr: logging.Logger) -> None:
 
 def init_signals() -> None:
     """Initialize signal handlers."""
-    signal.signal(signal.SIGHUP, signal_handler)
-    signal.signal(signal.SIGINT, signal_handler)
-    signal.signal(signal.SIGTERM, signal_handler)
-    signal.signal(signal.SIGUSR1, signal_handler)
-    signal.signal(signal.SIGUSR2, signal_handler)
-    signal.signal(signal.SIGIO, signal_handler)
-    signal.signal(signal.SIGALRM, signal_handler)
+    _SIG_DISPATCH.update({
+        signal.SIGUSR1: lcd_spotify.lcd.toggle_backlight,
+        signal.SIGUSR2: lcd_spotify.spotify_manager.toggle_track_liked,
+        signal.SIGIO: lcd_spotify.reset_countdown,
+        signal.SIGALRM: lcd_spotify.spotify_manager.next_track,
+        signal.SIGHUP: clear_lcd_and_exit,
+        signal.SIGINT: clear_lcd_and_exit,
+        signal.SIGTERM: clear_lcd_and_exit,
+    })
+    for signum in _SIG_DISPATCH:
+        signal.signal(signum, signal_handler)
+
+
+def init_wakeup() -> tuple[int, int]:
+    """
+    Initialize a pipe which becomes readable whenever a signal arrives.
+
+    Returns the read and write ends of the pipe.
+    """
+    read_fd, write_fd = os.pipe()
+    os.set_blocking(write_fd, False)
+    signal.set_wakeup_fd(write_fd)
+    return read_fd, write_fd
+
+
+def wake_main_loop(write_fd: int) -> None:
+    """
+    Wake the main loop from another thread.
+    """
+    with suppress(BlockingIOError):  # the pipe is full, so a wakeup is already pending
+        os.write(write_fd, b"\0")
+
+
+def wait_for_wakeup(read_fd: int, timeout: float) -> None:
+    """
+    Wait until the timeout expires, or until a signal arrives.
+    """
+    ready, _, _ = select.select([read_fd], [], [], max(timeout, 0.0))
+    if ready:
+        os.read(read_fd, 512)  # drain pending wakeups
 
 
 if __name__ == "__main__":
@@ -71,16 +107,17 @@ if __name__ == "__main__":
     lcd_spotify = LcdSpotify()
     init_logger(logger)
     init_signals()
+    wakeup_fd, wakeup_write_fd = init_wakeup()
+    lcd_spotify.start_polling(lambda: wake_main_loop(wakeup_write_fd))
+    delay = 0.0
     while True:
         try:
-            lcd_spotify.single_step()
-        except SpotifyException:
-            logger.exception("Spotify exception occurred")
-            clear_lcd_and_exit()
-        except RequestException:
-            logger.exception("Requests library exception occurred")
-            clear_lcd_and_exit()
+            wait_for_wakeup(wakeup_fd, delay)
+            delay = lcd_spotify.single_step()
+        except (SpotifyException, RequestException) as err:
+            # usually a network hiccup, so back off and try again
+            logger.warning("Recoverable exception occurred: %r", err)
+            delay = ERROR_RETRY_SECONDS
         except Exception:  # pylint: disable=broad-exception-caught
             logger.exception("Unknown exception occurred")
             clear_lcd_and_exit()
-        time.sleep(0.5)  # 0.5 seconds between lcd refreshes
@@ -8,11 +8,71 @@ Configuration management.
 from __future__ import annotations
 
 import dataclasses
+import functools
+from pathlib import Path
 from typing import Any
 
-import dotenv
 from typing_extensions import Self
 
+_INT_BASES = {"0x": 16, "0o": 8, "0b": 2}
+_TRUE_VALUES = frozenset({"y", "yes", "t", "true", "on", "1", 1})
+_FALSE_VALUES = frozenset({"n", "no", "f", "false", "off", "0", 0})
+_EXPORT = "export "
+
+
+def _parse_env(filename: str) -> dict[str, str]:
+    """
+    Parse a dotenv-style file into a dictionary.
+
+    The parsed values are cached, keyed on the file's modification time.
+    """
+    path = Path(filename)
+    return dict(_parse_env_cached(path, path.stat().st_mtime_ns))
+
+
+@functools.lru_cache(maxsize=4)
+def _parse_env_cached(path: Path, _mtime_ns: int) -> dict[str, str]:
+    values: dict[str, str] = {}
+    for raw_line in path.read_bytes().decode().split("\n"):
+        line = raw_line.strip()
+        key, sep, value = line.partition("=")
+        if sep and not line.startswith("#"):
+            # str.removeprefix would need Python 3.9
+            key = key[len(_EXPORT):] if key.startswith(_EXPORT) else key  # noqa: FURB188
+            values[key.strip()] = _parse_env_value(value.strip())
+    return values
+
+
+def _parse_env_value(value: str) -> str:
+    """
+    Strip quotes or a trailing comment from a dotenv-style value.
+
+    A quoted value ends at its closing quote; anything after that must be a comment.
+    Inline comments are only stripped from unquoted values.
+
+    Examples
+    --------
+    >>> _parse_env_value('"secret" # note')
+    'secret'
+    >>> _parse_env_value("'a' # c")
+    'a'
+    >>> _parse_env_value('"a # b"')
+    'a # b'
+    >>> _parse_env_value("value # comment")
+    'value'
+    >>> _parse_env_value("# comment")
+    ''
+    """
+    quote = value[:1]
+    if quote in {'"', "'"}:
+        end = value.find(quote, 1)
+        rest = value[end + 1:].lstrip()
+        if end > 0 and (not rest or rest.startswith("#")):
+            return value[1:end]
+    if value.startswith("#"):
+        return ""
+    return value.split(" #", 1)[0].rstrip()
+
 
 class IntConversionDescriptor:
     """Integer conversion descriptor object."""
@@ -31,15 +91,9 @@ class IntConversionDescriptor:
         return getattr(obj, self._name, self._default)
 
     def __set__(self, obj: object, value: Any) -> None:  # noqa: ANN401
-        base = 10
         if isinstance(value, str):
-            if value[:2] == "0x":
-                base = 16
-            if value[:2] == "0o":
-                base = 8
-            if value[:2] == "0b":
-                base = 2
-        setattr(obj, self._name, int(value, base))
+            value = int(value, _INT_BASES.get(value[:2].lower(), 10))
+        setattr(obj, self._name, int(value))
 
 
 class BoolConversionDescriptor:
@@ -59,13 +113,13 @@ class BoolConversionDescriptor:
         return getattr(obj, self._name, self._default)
 
     def __set__(self, obj: object, value: Any) -> None:  # noqa: ANN401
-        val = bool(value)
-        if isinstance(value, str):
-            value = value.lower()
-        if value in ["y", "yes", "t", "true", "on", "1", 1]:
+        key = value.lower() if isinstance(value, str) else value
+        if key in _TRUE_VALUES:
             val = True
-        elif value in ["n", "no", "f", "false", "off", "0", 0]:
+        elif key in _FALSE_VALUES:
             val = False
+        else:
+            val = bool(value)
         setattr(obj, self._name, val)
 
 
@@ -86,15 +140,7 @@ class Config:  # pylint: disable=too-many-instance-attributes
     @classmethod
     def load_from_file(cls, filename: str) -> Self:
         """Create a Config instance, loading data from a file."""
-        dotenv_config = dotenv.dotenv_values(dotenv_path=filename)
-        return cls(
-            lcd_backlight=dotenv_config["LCD_BACKLIGHT"],
-            ip_timeout=dotenv_config["IP_TIMEOUT"],
-            i2c_bus=dotenv_config["I2C_BUS"],
-            lcd_address=dotenv_config["LCD_ADDRESS"],
-            lcd_width=dotenv_config["LCD_WIDTH"],
-            lcd_rows=dotenv_config["LCD_ROWS"],
-            spotipy_client_id=dotenv_config["SPOTIPY_CLIENT_ID"],
-            spotipy_client_secret=dotenv_config["SPOTIPY_CLIENT_SECRET"],
-            spotipy_redirect_uri=dotenv_config["SPOTIPY_REDIRECT_URI"]
-        )
+        dotenv_config = _parse_env(filename)
+        return cls(**{
+            field.name: dotenv_config[field.name.upper()] for field in dataclasses.fields(cls)
+        })
@@ -7,7 +7,12 @@ Extended LCD class with convenience functions.
 
 from __future__ import annotations
 
-from rpi_lcd import LCD, LINES
+from typing import TYPE_CHECKING
+
+from rpi_lcd import ENABLE_BIT, LCD, LCD_BACKLIGHT, LCD_NOBACKLIGHT, LINES
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
 
 # Valid character positions
 CGRAM_SLOT1 = 0
@@ -19,15 +24,18 @@ CGRAM_SLOT6 = 5
 CGRAM_SLOT7 = 6
 CGRAM_SLOT8 = 7
 
+# Set CGRAM address commands for each slot
+CGRAM_COMMANDS = tuple(0x40 | (slot << 3) for slot in range(CGRAM_SLOT8 + 1))
+
 # Character codes for CGRAM slots
-CGRAM_CHR1 = chr(0)
-CGRAM_CHR2 = chr(1)
-CGRAM_CHR3 = chr(2)
-CGRAM_CHR4 = chr(3)
-CGRAM_CHR5 = chr(4)
-CGRAM_CHR6 = chr(5)
-CGRAM_CHR7 = chr(6)
-CGRAM_CHR8 = chr(7)
+CGRAM_CHR1 = chr(CGRAM_SLOT1)
+CGRAM_CHR2 = chr(CGRAM_SLOT2)
+CGRAM_CHR3 = chr(CGRAM_SLOT3)
+CGRAM_CHR4 = chr(CGRAM_SLOT4)
+CGRAM_CHR5 = chr(CGRAM_SLOT5)
+CGRAM_CHR6 = chr(CGRAM_SLOT6)
+CGRAM_CHR7 = chr(CGRAM_SLOT7)
+CGRAM_CHR8 = chr(CGRAM_SLOT8)
 
 # Custom characters available to load into LCD's CGRAM
 # Note that LCDs using the Hitachi HD44780 controller only allow for 8 custom characters
@@ -78,16 +86,31 @@ CHR_BATTERY_FULL  = CHR_BATTERY6
 
 CHR_DATA_LENGTH = 8
 
+# DDRAM address commands for the start of each line
+LINE_ADDRESSES = (LINES[1], LINES[2], LINES.get(3, 0x94), LINES.get(4, 0xD4))
+
+# SMBus block writes carry a command byte plus at most 32 data bytes
+I2C_BLOCK_MAX = 32
+
 
 class ExtendedLcd(LCD):
     """
     Extended LCD class with convenience functions.
     """
 
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        # Last known contents of each line, or None if unknown
+        self.shadow: list[str | None] = [None] * self.rows
+        # Glyphs uploaded to each CGRAM slot, or None if not yet uploaded
+        self.cgram: list[list[int] | None] = [None] * len(CGRAM_COMMANDS)
+
     def save_cgram_char(self, slot: int, bytedata: list[int]) -> None:
         """
         Load bytedata into LCD's CGRAM.
 
+        The upload is skipped if the slot already holds the same glyph.
+
         Parameters
         ----------
         slot: An integer between 0 and 7, inclusive
@@ -102,9 +125,51 @@ class ExtendedLcd(LCD):
         if len(bytedata) != CHR_DATA_LENGTH:
             msg = "Bytes list must contain exactly 8 values"
             raise ValueError(msg)
-        self.write(0x40 | (int(slot) << 3), mode=0)
-        for byte in bytedata:
-            self.write(byte, mode=1)
+        if self.cgram[slot] == bytedata:
+            return
+        self._write_frames(
+            self._byte_frames([CGRAM_COMMANDS[slot]], mode=0)
+            + self._byte_frames(bytedata, mode=1)
+        )
+        self.cgram[slot] = list(bytedata)
+
+    def write_block(self, data: Iterable[int], mode: int = 1) -> None:
+        """
+        Write a sequence of bytes to the LCD using as few I2C transactions as possible.
+
+        Parameters
+        ----------
+        data: The bytes to write
+        mode: 0 for commands, 1 for character data
+        """
+        self._write_frames(self._byte_frames(data, mode))
+
+    def _byte_frames(self, data: Iterable[int], mode: int) -> list[int]:
+        """
+        Encode bytes as the I2C expander frames which clock them into the LCD.
+
+        Each byte is sent as two nibbles, and each nibble is latched by pulsing the enable bit.
+        The backlight bit is left clear; _write_frames adds it.
+        """
+        frames: list[int] = []
+        for byte in data:
+            for nibble in (byte & 0xF0, (byte << 4) & 0xF0):
+                value = mode | nibble
+                frames += (value, value | ENABLE_BIT, value & ~ENABLE_BIT)
+        return frames
+
+    def _write_frames(self, frames: list[int]) -> None:
+        """
+        Write I2C expander frames to the LCD in block transactions.
+
+        The backlight bit is read for each block, so a backlight toggled part way through
+        (by a signal handler) isn't undone by the remaining blocks.
+        """
+        step = I2C_BLOCK_MAX + 1
+        for idx in range(0, len(frames), step):
+            backlight_mode = LCD_BACKLIGHT if self.backlight_status else LCD_NOBACKLIGHT
+            block = [frame | backlight_mode for frame in frames[idx:idx + step]]
+            self.bus.write_i2c_block_data(self.address, block[0], block[1:])
 
     def position_text(self, text: str, line: int, column: int = 1) -> None:
         """
@@ -121,14 +186,63 @@ class ExtendedLcd(LCD):
         if not 1 <= line <= self.rows:
             msg = f"Line {line} out of range"
             raise ValueError(msg)
-        if not 0 <= column <= self.width:
+        if not 1 <= column <= self.width:
             msg = f"Column {column} out of range"
             raise ValueError(msg)
-        self.write(LINES.get(line, LINES[1] | (column - 1)))
-        for idx, ch in enumerate(text):
-            self.write(ord(ch), mode=1)
-            if column + idx > self.width:
-                break
+        self.write(LINE_ADDRESSES[line - 1] + column - 1)
+        self.write_block(text[:self.width - column + 1].encode("latin-1", "replace"), mode=1)
+        self.shadow[line - 1] = None
+
+    def update_line(self, text: str, line: int) -> None:
+        """
+        Display text on a line, sending only the characters which have changed.
+
+        The text is truncated or padded with spaces to fill the line. Each run of
+        changed characters is written after its own cursor move, all in one batch.
+
+        Parameters
+        ----------
+        text: The string to display on the LCD
+        line: The line to display the text (1-based)
+        """
+        if not 1 <= line <= self.rows:
+            msg = f"Line {line} out of range"
+            raise ValueError(msg)
+        text = text[:self.width].ljust(self.width)
+        old = self.shadow[line - 1]
+        if old == text:
+            return
+        frames: list[int] = []
+        for first, last in self._changed_runs(text, old):
+            frames += self._byte_frames([LINE_ADDRESSES[line - 1] + first], mode=0)
+            frames += self._byte_frames(text[first:last].encode("latin-1", "replace"), mode=1)
+        self._write_frames(frames)
+        self.shadow[line - 1] = text
+
+    def _changed_runs(self, text: str, old: str | None) -> list[tuple[int, int]]:
+        """
+        Find the runs of columns where text differs from old, as (first, last) pairs.
+
+        A cursor move costs as much as one character, so runs separated by a single
+        unchanged column are merged.
+        """
+        if old is None:
+            return [(0, self.width)]
+        runs: list[tuple[int, int]] = []
+        for col in range(self.width):
+            if text[col] != old[col]:
+                if runs and col - runs[-1][1] <= 1:
+                    runs[-1] = (runs[-1][0], col + 1)
+                else:
+                    runs.append((col, col + 1))
+        return runs
+
+    def text(self, text: str, line: int, align: str = "left") -> None:
+        """
+        Display text on a line, wrapping onto following lines if needed.
+        """
+        super().text(text, line, align)
+        self.shadow = [None] * self.rows
 
     def toggle_backlight(self) -> None:
         """
@@ -142,6 +256,7 @@ class ExtendedLcd(LCD):
         """
         super().clear()
         self.backlight(False)
+        self.shadow = [" " * self.width] * self.rows
 
     def __str__(self) -> str:
         name = self.__class__.__name__
@@ -8,8 +8,12 @@ Display currently playing Spotify track on LCD.
 from __future__ import annotations
 
 import logging
+import threading
 import time
-from contextlib import suppress
+from typing import TYPE_CHECKING
+
+from requests.exceptions import RequestException
+from spotipy.exceptions import SpotifyException
 
 import extended_lcd
 import tools
@@ -17,14 +21,22 @@ from config import Config
 from extended_lcd import ExtendedLcd
 from spotify_manager import SpotifyManager
 
-BIPS = 4
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+BIPS = 4  # display refreshes per Spotify poll
+TICK = 0.5  # seconds between display refreshes while text is scrolling
+IDLE_POLL_SECONDS = 10.0  # seconds between Spotify polls while nothing is playing
+ERROR_RETRY_SECONDS = 5.0  # seconds to back off after a recoverable error
 CONFIGFILE = "config.env"
+IP_CACHE_SECONDS = 30.0
 WRAP_PAD = " " * 4
+TRACK_FIELDS = ("artist", "track", "album")  # one per LCD row, in display order
 
 logger = logging.getLogger(__name__)
 
 
-class LcdSpotify:
+class LcdSpotify:  # pylint: disable=too-many-instance-attributes
     """
     Display currently playing Spotify track on LCD.
     """
@@ -68,94 +80,249 @@ class LcdSpotify:
         self.load_config()
         self.init_hardware()
         self.init_spotify()
-        self.countdown = 0.0
-        self.bip = 0
+        self.countdown = float("-inf")  # monotonic time the banner was requested
+        self.poll_error: Exception | None = None
+        self.hostname = tools.gethostname()
+        self.ip_address = ""
+        self.ip_expiry = 0.0
+        self.host_info = ("", "")
+        self.host_lines = ("", "")
+        self.clock_second = -1
+        self.clock_day = -1
+        self.clock_lines = ("", "")
         self.offsets = {
             "album": 0,
             "artist": 0,
             "track": 0,
         }
+        self.wrap_buffers: dict[str, tuple[str, str]] = {}
+        self.next_scroll = 0.0
+        self.track_fields = ("", "", "")
+        self.display_fields = ("", "", "")
 
     def reset_countdown(self) -> None:
         """
         Reset the countdown timer.
+
+        Also refresh the cached host name and IP address, since they are about to be displayed.
+        """
+        self.countdown = time.monotonic()
+        self.hostname = tools.gethostname()
+        self.ip_expiry = 0.0
+
+    def get_ip_address(self) -> str:
+        """
+        Get the IP address, refreshing the cached value every IP_CACHE_SECONDS seconds.
+
+        An empty address (no network yet) is never cached.
         """
-        self.countdown = time.time()
+        now = time.monotonic()
+        if not self.ip_address or now >= self.ip_expiry:
+            self.ip_address = tools.net_addr()
+            self.ip_expiry = now + IP_CACHE_SECONDS
+        return self.ip_address
+
+    def banner_remaining(self) -> float:
+        """
+        Get the number of seconds the host/IP address banner has left to display.
+
+        Measured on the monotonic clock, so NTP stepping the wall clock can't stretch it.
+        """
+        return self.config.ip_timeout - (time.monotonic() - self.countdown)
+
+    def poll_spotify(self) -> float:
+        """
+        Retrieve the current track from Spotify.
+
+        Polling is skipped while the host/IP address banner is showing, since the track
+        isn't displayed; the next poll happens as soon as the banner ends.
+
+        Returns the number of seconds until the next poll is needed.
+        """
+        banner_remaining = self.banner_remaining()
+        if banner_remaining > 0:
+            return banner_remaining
+        try:
+            self.spotify_manager.retrieve_track_data()
+        except (SpotifyException, RequestException) as err:
+            # usually a network hiccup, so back off and try again
+            logger.warning("Recoverable exception occurred: %r", err)
+            return ERROR_RETRY_SECONDS
+        return TICK * BIPS if self.spotify_manager.is_track_playing() else IDLE_POLL_SECONDS
+
+    def start_polling(self, on_update: Callable[[], None]) -> None:
+        """
+        Poll Spotify in a background thread, so network latency never stalls the display.
+
+        on_update is called after every poll, to wake the display loop. Unexpected
+        exceptions stop polling and are re-raised by the next single_step.
+        """
+
+        def poll_forever() -> None:
+            try:
+                while True:
+                    delay = self.poll_spotify()
+                    on_update()
+                    time.sleep(delay)
+            except Exception as err:  # noqa: BLE001  # pylint: disable=broad-exception-caught
+                self.poll_error = err
+                on_update()
+
+        threading.Thread(target=poll_forever, name="spotify-poller", daemon=True).start()
 
     def increment_display_offsets(self) -> None:
         """
-        Return the offset numbers for the display data.
+        Advance the scrolling offsets for the display data, or reset them on a new track.
+
+        Offsets only advance once every TICK seconds, so early wakeups (new poll data,
+        signals) redraw the display without speeding up the scrolling.
         """
-        if self.spotify_manager.update_last_track():
+        manager = self.spotify_manager
+        offsets = self.offsets
+        if manager.update_last_track():
             logger.info(
                 "%s::%s::%s",
-                self.spotify_manager.get_artist(),
-                self.spotify_manager.get_track_name(),
-                self.spotify_manager.get_album_name(),
-            )
-            self.offsets["artist"] = 0
-            self.offsets["album"] = 0
-            self.offsets["track"] = 0
-        else:
-            self.offsets["artist"] = tools.add_to_max(
-                self.offsets["artist"], 1,
-                len(self.spotify_manager.get_artist()) + len(WRAP_PAD)
-            )
-            self.offsets["track"] = tools.add_to_max(
-                self.offsets["track"], 1,
-                len(self.spotify_manager.get_track_name()) + len(WRAP_PAD)
-            )
-            self.offsets["album"] = tools.add_to_max(
-                self.offsets["album"], 1,
-                len(self.spotify_manager.get_album_name()) + len(WRAP_PAD)
+                manager.get_artist(),
+                manager.get_track_name(),
+                manager.get_album_name(),
             )
+            offsets["artist"] = 0
+            offsets["album"] = 0
+            offsets["track"] = 0
+            self.next_scroll = time.monotonic() + TICK
+        elif (now := time.monotonic()) >= self.next_scroll:
+            self.next_scroll = now + TICK
+            # a scrolling field's buffer is its padded string twice over
+            width = self.lcd.width
+            for field, (_, buffer) in self.wrap_buffers.items():
+                if len(buffer) > width:
+                    offsets[field] = (offsets[field] + 1) % (len(buffer) // 2)
 
-    def offset_wrap(self, string: str, offset: int) -> str:
+    def offset_wrap(self, field: str, string: str) -> str:
         """
-        Wrap a string with a given offset, to fit the LCD width.
+        Wrap a field's string at the field's current offset, to fit the LCD width.
+
+        The wrap buffer for each field is cached until the field's string changes.
         """
-        return tools.substr_wrap(string, offset, self.lcd.width, WRAP_PAD)
+        width = self.lcd.width
+        source, buffer = self.wrap_buffers.get(field, ("", ""))
+        if source != string:
+            buffer = tools.wrap_buffer(string, width, WRAP_PAD)
+            self.wrap_buffers[field] = (string, buffer)
+        return tools.wrap_slice(buffer, self.offsets[field], width)
 
     def _get_liked_artist(self, artist_name: str) -> str:
         if self.spotify_manager.is_track_liked():
             return extended_lcd.CGRAM_CHR1 + artist_name
         return artist_name
 
-    def single_step(self) -> None:
+    def show_lines(self, *lines: str) -> None:
+        """
+        Display the given lines on the LCD, blanking any remaining rows.
+
+        Lines beyond the number of rows on the LCD are dropped.
+        """
+        update_line = self.lcd.update_line
+        for line in range(1, self.lcd.rows + 1):
+            text = lines[line - 1] if line <= len(lines) else ""
+            update_line(text, line)
+
+    def is_scrolling(self) -> bool:
+        """
+        Determine if any of the displayed track fields are too wide to fit the LCD.
+
+        Fields beyond the number of rows on the LCD are never shown, so are ignored.
+        """
+        width = self.lcd.width
+        buffers = self.wrap_buffers
+        return any(
+            len(buffers[field][1]) > width
+            for field in TRACK_FIELDS[:self.lcd.rows]
+            if field in buffers
+        )
+
+    def show_host_info(self) -> None:
+        """
+        Display the host name and IP address.
+
+        The formatted lines are only rebuilt when the host name or IP address changes.
+        """
+        host_info = (self.hostname, self.get_ip_address())
+        if host_info != self.host_info:
+            self.host_info = host_info
+            width = self.lcd.width
+            self.host_lines = (
+                f"HOST: {host_info[0]}".center(width),
+                f"IP: {host_info[1]}".center(width),
+            )
+        self.show_lines(*self.host_lines)
+
+    def get_display_fields(self) -> tuple[str, str, str]:
+        """
+        Get the current track's artist, name and album, with diacritics removed.
+
+        The converted strings are cached until the track changes.
+        """
+        manager = self.spotify_manager
+        fields = (manager.get_artist(), manager.get_track_name(), manager.get_album_name())
+        if fields != self.track_fields:
+            self.track_fields = fields
+            artist, track, album = fields
+            fold = tools.remove_diacritics
+            self.display_fields = (fold(artist), fold(track), fold(album))
+        return self.display_fields
+
+    def show_track(self) -> None:
+        """
+        Display the current track's artist, name and album.
+        """
+        artist_name, track_name, album_name = self.get_display_fields()
+        self.increment_display_offsets()
+        artist = self.offset_wrap("artist", self._get_liked_artist(artist_name))
+        track = self.offset_wrap("track", track_name)
+        album = self.offset_wrap("album", album_name)
+        # a 16x2 LCD only has room for artist and track
+        self.show_lines(artist, track, album)
+
+    def show_clock(self) -> None:
+        """
+        Display the current time and date.
+
+        The formatted lines are only rebuilt when the second (or, for the date, the day) changes.
+        """
+        now = int(time.time())
+        if now != self.clock_second:
+            self.clock_second = now
+            local = time.localtime(now)
+            width = self.lcd.width
+            date_line = self.clock_lines[1]
+            if local.tm_yday != self.clock_day:
+                self.clock_day = local.tm_yday
+                date_line = time.strftime("%Y-%m-%d", local).center(width)
+            self.clock_lines = (time.strftime("%H:%M:%S", local).center(width), date_line)
+        self.show_lines(*self.clock_lines)
+
+    def single_step(self) -> float:
         """
         Run a single step of display loop.
 
-        Get currently playing Spotify track, then display information on LCD:
+        Display the most recently polled Spotify track information on LCD:
             * If user requested host/IP address, display it for IP_TIMEOUT seconds.
             * If Spotify is currently playing, display track information.
             * Otherwise, display current time and date.
+
+        Returns the number of seconds until the next step is needed. The polling
+        thread also wakes the display loop whenever new track data arrives.
         """
-        if self.bip == 0:
-            self.spotify_manager.retrieve_track_data()
-        self.bip = (self.bip + 1) % BIPS
-        if time.time() - self.countdown < self.config.ip_timeout:
-            self.lcd.text(f"HOST: {tools.gethostname()}", 1, "center")
-            self.lcd.text(f"IP: {tools.net_addr()}", 2, "center")
-        elif self.spotify_manager.is_track_playing():
-            artist_name = tools.remove_diacritics(self.spotify_manager.get_artist())
-            artist_display = self._get_liked_artist(artist_name)
-            self.increment_display_offsets()
-            artist = self.offset_wrap(artist_display, self.offsets["artist"])
-            track = self.offset_wrap(
-                tools.remove_diacritics(
-                    self.spotify_manager.get_track_name()
-                ), self.offsets["track"]
-            )
-            album = self.offset_wrap(
-                tools.remove_diacritics(
-                    self.spotify_manager.get_album_name()
-                ), self.offsets["album"]
-            )
-            with suppress(ValueError):
-                self.lcd.position_text(artist.ljust(self.lcd.width), 1)
-                self.lcd.position_text(track.ljust(self.lcd.width), 2)
-                # a 16x2 LCD will throw a ValueError here, but a 20x4 won't
-                self.lcd.position_text(album.ljust(self.lcd.width), 3)
-        else:
-            self.lcd.text(time.strftime("%H:%M:%S"), 1, "center")
-            self.lcd.text(time.strftime("%Y-%m-%d"), 2, "center")
+        if self.poll_error is not None:
+            raise self.poll_error
+        if self.banner_remaining() > 0:
+            self.show_host_info()
+            return TICK
+        if self.spotify_manager.is_track_playing():
+            self.show_track()
+            if self.is_scrolling():
+                return self.next_scroll - time.monotonic()
+            return TICK * BIPS
+        self.show_clock()
+        return 1.0 - time.time() % 1.0
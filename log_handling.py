@@ -10,20 +10,18 @@ from __future__ import annotations
 import logging
 
 
-class LogFilter(logging.Filterer):
+class LogFilter(logging.Filter):  # pylint: disable=too-few-public-methods
     """
     Custom filtering for logging facility.
     """
 
+    blocked_prefixes = ("spotipy", "urllib3")
+
     def filter(self, record: logging.LogRecord) -> bool:
         """Filter the log record."""
-        if record.name.startswith("spotipy"):
-            return False
-        if record.name.startswith("urllib3"):
-            return False
         # if record.levelno > logging.DEBUG:
         #     return False
-        return True
+        return not record.name.startswith(self.blocked_prefixes)
 
 
 class LogFormatter(logging.Formatter):
@@ -34,11 +32,13 @@ class LogFormatter(logging.Formatter):
     def __init__(self) -> None:
         super().__init__()
         self.default_format = "%(levelname)s:%(name)s:%(message)s"
+        self.info_formatter = logging.Formatter("%(message)s")
+        self.default_formatter = logging.Formatter(self.default_format)
 
     def format(self, record: logging.LogRecord) -> str:
         """
         Format the log record.
         """
-        log_fmt = "%(message)s" if record.levelno == logging.INFO else self.default_format
-        formatter = logging.Formatter(log_fmt)
-        return formatter.format(record)
+        if record.levelno == logging.INFO:
+            return self.info_formatter.format(record)
+        return self.default_formatter.format(record)
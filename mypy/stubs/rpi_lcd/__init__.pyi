@@ -1,3 +1,5 @@
+from typing import Any
+
 ALIGN_FUNC: dict[str, str]
 CLEAR_DISPLAY: int
 ENABLE_BIT: int
@@ -7,7 +9,7 @@ LCD_NOBACKLIGHT: int
 
 class LCD:
     address: int
-    bus: int
+    bus: Any
     delay: float
     rows: int
     width: int
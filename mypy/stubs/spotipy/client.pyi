@@ -13,13 +13,13 @@ class Spotify:
     client_credentials_manager: SpotifyClientCredentials
     oauth_manager: SpotifyOAuth
     proxies: Incomplete
-    requests_timeout: int
+    requests_timeout: int | tuple[float, float]
     status_forcelist: Incomplete
     backoff_factor: float
     retries: int
     status_retries: int
     language: Optional[str]
-    def __init__(self, auth: str | None = None, requests_session: bool = True, client_credentials_manager: SpotifyClientCredentials | None = None, oauth_manager: SpotifyOAuth | None = None, auth_manager: SpotifyOAuth | SpotifyClientCredentials | SpotifyImplicitGrant | None = None, proxies: Incomplete | None = None, requests_timeout: int = 5, status_forcelist: Incomplete | None = None, retries=..., status_retries=..., backoff_factor: float = 0.3, language: Incomplete | None = None) -> None: ...
+    def __init__(self, auth: str | None = None, requests_session: bool | Incomplete = True, client_credentials_manager: SpotifyClientCredentials | None = None, oauth_manager: SpotifyOAuth | None = None, auth_manager: SpotifyOAuth | SpotifyClientCredentials | SpotifyImplicitGrant | None = None, proxies: Incomplete | None = None, requests_timeout: int | tuple[float, float] = 5, status_forcelist: Incomplete | None = None, retries=..., status_retries=..., backoff_factor: float = 0.3, language: Incomplete | None = None) -> None: ...
     def set_auth(self, auth: str) -> None: ...
     @property
     def auth_manager(self): ...
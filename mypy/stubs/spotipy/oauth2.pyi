@@ -52,7 +52,7 @@ class SpotifyOAuth(SpotifyAuthBase):
     requests_timeout: Incomplete
     show_dialog: Incomplete
     open_browser: Incomplete
-    def __init__(self, client_id: Incomplete | None = None, client_secret: Incomplete | None = None, redirect_uri: Incomplete | None = None, state: Incomplete | None = None, scope: Incomplete | None = None, cache_path: Incomplete | None = None, username: Incomplete | None = None, proxies: Incomplete | None = None, show_dialog: bool = False, requests_session: bool = True, requests_timeout: Incomplete | None = None, open_browser: bool = True, cache_handler: Incomplete | None = None) -> None: ...
+    def __init__(self, client_id: Incomplete | None = None, client_secret: Incomplete | None = None, redirect_uri: Incomplete | None = None, state: Incomplete | None = None, scope: Incomplete | None = None, cache_path: Incomplete | None = None, username: Incomplete | None = None, proxies: Incomplete | None = None, show_dialog: bool = False, requests_session: bool | Incomplete = True, requests_timeout: Incomplete | None = None, open_browser: bool = True, cache_handler: Incomplete | None = None) -> None: ...
     def validate_token(self, token_info): ...
     def get_authorize_url(self, state: Incomplete | None = None): ...
     def parse_response_code(self, url): ...
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+
+"""
+Prototype checking that repeated 304 Not Modified answers reuse one pooled connection.
+
+A local HTTP server stands in for the Spotify API, always answering with the same ETag.
+"""
+
+# SPDX-FileCopyrightText: © 2024 Stacey Adams <stacey.belle.rose@gmail.com>
+# SPDX-License-Identifier: MIT
+
+from __future__ import annotations
+
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
+
+sys.path.insert(0, "..")
+from spotify_manager import ETAG_PATHS, ConditionalGetAdapter  # noqa: E402
+
+ETAG = '"v1"'
+BODY = b'{"is_playing": true}'
+REQUESTS = 10
+
+connections: list[tuple[str, int]] = []
+
+
+class Handler(BaseHTTPRequestHandler):
+    """
+    Answer every request with the same ETag, counting the connections made.
+    """
+
+    protocol_version = "HTTP/1.1"
+
+    def setup(self) -> None:
+        """Count each new connection."""
+        super().setup()
+        connections.append(self.client_address)
+
+    def do_GET(self) -> None:  # noqa: N802  # pylint: disable=invalid-name
+        """Answer 304 when the client already has the current ETag."""
+        if self.headers.get("If-None-Match") == ETAG:
+            self.send_response(304)
+            self.send_header("ETag", ETAG)
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header("ETag", ETAG)
+        self.send_header("Content-Length", str(len(BODY)))
+        self.end_headers()
+        self.wfile.write(BODY)
+
+    def log_message(self, *_args) -> None:
+        """Keep the output quiet."""
+
+
+server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+threading.Thread(target=server.serve_forever, daemon=True).start()
+
+session = requests.Session()
+session.mount("http://", ConditionalGetAdapter(pool_connections=1, pool_maxsize=1))
+url = f"http://127.0.0.1:{server.server_port}{ETAG_PATHS[0]}"
+bodies = {session.get(url, timeout=5).content for _ in range(REQUESTS)}
+server.shutdown()
+
+print("Bodies:", bodies)
+print("Connections:", len(connections))
+if bodies != {BODY} or len(connections) != 1:
+    print("FAILED: expected one body and one connection")
+    sys.exit(1)
+print("OK")
@@ -7,19 +7,26 @@ Prototype showing how to connect to spotify and retrieve the currently playing t
 # SPDX-FileCopyrightText: © 2022 Stacey Adams <stacey.belle.rose@gmail.com>
 # SPDX-License-Identifier: MIT
 
-import dotenv
+import sys
+
 import spotipy
 from spotipy.cache_handler import CacheFileHandler
 from spotipy.oauth2 import SpotifyOAuth
 
+sys.path.insert(0, "..")
+from config import Config  # noqa: E402
+
 CACHEFILE = "../.cache-spotipy"
 
-dotenv.load_dotenv(dotenv_path="../config.env")
+config = Config.load_from_file("../config.env")
 
 SCOPE = "user-read-playback-state user-library-read"
 
 sp = spotipy.Spotify(
     auth_manager=SpotifyOAuth(
+        client_id=config.spotipy_client_id,
+        client_secret=config.spotipy_client_secret,
+        redirect_uri=config.spotipy_redirect_uri,
         scope=SCOPE,
         open_browser=False,
         cache_handler=CacheFileHandler(cache_path=CACHEFILE)
@@ -9,13 +9,30 @@ from __future__ import annotations
 
 import dataclasses
 import logging
+import threading
+from collections import OrderedDict
 
 import requests
 import spotipy
+from requests.adapters import HTTPAdapter
 from spotipy.cache_handler import CacheFileHandler
 from spotipy.oauth2 import SpotifyOAuth
+from urllib3.util.retry import Retry
 
 CACHEFILE = ".cache-spotipy"
+LIKED_CACHE_SIZE = 128
+# GET endpoints worth revalidating with ETags, as they are polled repeatedly
+ETAG_PATHS = ("/v1/me/player/currently-playing",)
+SPOTIFY_TIMEOUT = (2, 5)  # (connect, read) seconds
+# Reads are never retried: a POST (next track) or PUT/DELETE (like) that timed out
+# waiting for its response may already have been applied.
+SPOTIFY_RETRY = Retry(
+    total=2,
+    read=False,
+    backoff_factor=0.3,
+    status_forcelist=(429, 500, 502, 503, 504),
+    allowed_methods=frozenset(["GET", "POST", "PUT", "DELETE"]),
+)
 SPOTIFY_SCOPE = " ".join(  # noqa: FLY002
     [
         "user-read-playback-state",
@@ -34,6 +51,8 @@ class TrackData:
     Track Information.
     """
 
+    __slots__ = ("album", "artist", "id", "is_liked", "is_playing", "name")
+
     id: str
     name: str
     album: str
@@ -42,22 +61,50 @@ class TrackData:
     is_liked: bool
 
     def __eq__(self, other: object) -> bool:
+        # playing and liked are state, not identity; local files have no id, so compare names too
         if other is self:
             return True
-        if isinstance(other, self.__class__):
-            return (
-                self.id == other.id
-                and self.name == other.name
-                and self.album == other.album
-                and self.artist == other.artist
-            )
-        return False
+        # exact class, so a subclass with more identity fields never compares equal
+        if type(other) is not TrackData:  # pylint: disable=unidiomatic-typecheck
+            return False
+        return (self.id, self.name, self.album, self.artist) == (
+            other.id, other.name, other.album, other.artist
+        )
 
-    def __ne__(self, other: object) -> bool:
-        return not self.__eq__(other)
 
+class ConditionalGetAdapter(HTTPAdapter):
+    """
+    HTTP adapter which revalidates repeated GETs to ETAG_PATHS with If-None-Match.
 
-class SpotifyManager:
+    When the server answers 304 Not Modified, the previously received body is replayed
+    as a 200 response, so callers always see a complete response.
+    """
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._etags: dict[str, tuple[str, bytes]] = {}
+
+    def send(self, request: requests.PreparedRequest, *args, **kwargs) -> requests.Response:
+        """Send the request, adding or honoring an ETag where one is known."""
+        url = request.url or ""
+        if request.method != "GET" or request.path_url.split("?")[0] not in ETAG_PATHS:
+            return super().send(request, *args, **kwargs)
+        cached = self._etags.get(url)
+        if cached is not None:
+            request.headers["If-None-Match"] = cached[0]
+        response = super().send(request, *args, **kwargs)
+        if response.status_code == requests.codes.not_modified and cached is not None:
+            _ = response.content  # read the empty body, releasing the connection to the pool
+            response.status_code = requests.codes.ok
+            response._content = cached[1]  # noqa: SLF001  # pylint: disable=protected-access
+        elif response.status_code == requests.codes.ok and "ETag" in response.headers:
+            self._etags[url] = (response.headers["ETag"], response.content)
+        else:
+            self._etags.pop(url, None)
+        return response
+
+
+class SpotifyManager:  # pylint: disable=too-many-instance-attributes
     """
     Spotify API Manager.
     """
@@ -66,6 +113,7 @@ class SpotifyManager:
         self, client_id: str | None = None, client_secret: str | None = None,
         redirect_uri: str | None = None
     ) -> None:
+        self.session = self._build_session()
         self.cfh = CacheFileHandler(cache_path=CACHEFILE)
         self.spo = SpotifyOAuth(
             client_id=client_id,
@@ -73,13 +121,39 @@ class SpotifyManager:
             redirect_uri=redirect_uri,
             scope=SPOTIFY_SCOPE,
             open_browser=False,
-            cache_handler=self.cfh
+            cache_handler=self.cfh,
+            requests_session=self.session,
+            requests_timeout=SPOTIFY_TIMEOUT
         )
         self.sp = spotipy.Spotify(
-            auth_manager=self.spo
+            auth_manager=self.spo,
+            requests_session=self.session,
+            requests_timeout=SPOTIFY_TIMEOUT
         )
         self.current_track: TrackData | None = None
         self.last_track: TrackData | None = None
+        self._liked_cache: OrderedDict[str, bool] = OrderedDict()
+        # Bumped by every toggle, so a poll can tell when its liked state went stale
+        self.like_generation = 0
+        # Guards current_track between the polling thread and signal handlers.
+        # Reentrant, since a signal handler may interrupt another one.
+        self.lock = threading.RLock()
+
+    @staticmethod
+    def _build_session() -> requests.Session:
+        """
+        Build a keep-alive HTTP session shared by all Spotify API calls.
+
+        Only the API and accounts hosts are contacted, so the connection pools stay small.
+        """
+        session = requests.Session()
+        session.mount(
+            "https://",
+            ConditionalGetAdapter(
+                pool_connections=2, pool_maxsize=2, max_retries=SPOTIFY_RETRY
+            )
+        )
+        return session
 
     def next_track(self) -> None:
         """
@@ -96,46 +170,73 @@ class SpotifyManager:
         """
         Toggle the Track Likes flag on Spotify.
         """
-        if self.current_track and self.current_track.is_playing:
+        with self.lock:
+            self._toggle_track_liked()
+
+    def _toggle_track_liked(self) -> None:
+        track = self.current_track
+        if track and track.is_playing:
             try:
                 logger.info("Toggling whether track is liked")
-                if self.current_track.is_liked:
-                    self.sp.current_user_saved_tracks_delete([self.current_track.id])
+                if track.is_liked:
+                    self.sp.current_user_saved_tracks_delete([track.id])
                 else:
-                    self.sp.current_user_saved_tracks_add([self.current_track.id])
+                    self.sp.current_user_saved_tracks_add([track.id])
+                track.is_liked = not track.is_liked
+                self._remember_liked(track.id, track_liked=track.is_liked)
+                self.like_generation += 1
             except requests.exceptions.Timeout:
                 logger.warning("Spotify call (current_user_saved_tracks_add/delete) timed out")
 
     def retrieve_track_data(self) -> None:
         """
         Retrieve currently playing track from Spotify.
+
+        Whether the track is liked is only asked of Spotify when needed; see _is_track_liked.
+        The lock is only held to swap in the new track, never across a Spotify call.
         """
         try:
             logger.debug("Retrieving track data from Spotify")
             track = self.sp.current_user_playing_track()
-            if track is not None:
-                track_details = track["item"]
-                track_id = track_details["id"]
-                artist_name, album_name = self._get_artist_and_album_from_track(track)
-                track_liked = self._ask_spotify_if_track_liked(track_id)
-                self.current_track = TrackData(
-                    track_id,
-                    track_details["name"],
-                    album_name,
-                    artist_name,
-                    track["is_playing"],
-                    track_liked
-                )
-            else:
-                self.current_track = None
+            with self.lock:
+                generation = self.like_generation
+            track_data = self._build_track_data(track, generation)
+            with self.lock:
+                self._swap_current_track(track_data, generation)
         except requests.exceptions.Timeout:
             logger.warning("Spotify call (current_user_playing_track) timed out")
 
+    def _swap_current_track(self, track_data: TrackData | None, generation: int) -> None:
+        """
+        Make the polled track current; the lock must be held.
+
+        If the liked state was toggled since generation, the toggled state wins over the
+        state read while polling.
+        """
+        if track_data is not None and self.like_generation != generation:
+            track_data.is_liked = self._liked_cache.get(track_data.id, track_data.is_liked)
+        self.current_track = track_data
+
+    def _build_track_data(self, track: dict | None, generation: int) -> TrackData | None:
+        if track is None:
+            return None
+        track_details = track["item"]
+        track_id = track_details["id"]
+        artist_name, album_name = self._get_artist_and_album_from_track(track)
+        is_playing = track["is_playing"]
+        return TrackData(
+            track_id,
+            track_details["name"],
+            album_name,
+            artist_name,
+            is_playing,
+            self._is_track_liked(track_id, is_playing=is_playing, generation=generation)
+        )
+
     def _get_artist_and_album_from_track(self, track: dict) -> tuple[str, str]:
         track_details = track["item"]
         if track["currently_playing_type"] == "track":
-            artists = [artist["name"] for artist in track_details["artists"]]
-            artist_name = ", ".join(artists)
+            artist_name = ", ".join([artist["name"] for artist in track_details["artists"]])
             album_name = track_details["album"]["name"]
         elif track["currently_playing_type"] == "episode":
             artist_name = track_details["show"]["publisher"]
@@ -145,16 +246,64 @@ class SpotifyManager:
             album_name = ""
         return (artist_name, album_name)
 
-    def _ask_spotify_if_track_liked(self, track_id: str) -> bool:
+    def _is_track_liked(self, track_id: str, *, is_playing: bool, generation: int) -> bool:
+        """
+        Determine if a track is liked, asking Spotify only when needed.
+
+        Spotify is asked when the current track's playing state changes, or when a new
+        track has not been seen recently. Otherwise the remembered answer is used.
+        Spotify is asked without holding the lock, so a slow network never blocks
+        the signal handlers. Its answer is only remembered if the liked state hasn't been
+        toggled since generation.
+        """
+        with self.lock:
+            track_liked = self._remembered_liked(track_id, is_playing=is_playing)
+        if track_liked is not None:
+            return track_liked
+        track_liked = self._ask_spotify_if_track_liked(track_id)
+        if track_liked is None:
+            return False
+        with self.lock:
+            if self.like_generation == generation:
+                self._remember_liked(track_id, track_liked=track_liked)
+        return track_liked
+
+    def _remembered_liked(self, track_id: str, *, is_playing: bool) -> bool | None:
+        """
+        Determine if a track is liked, from the current track or the liked cache.
+
+        Returns None if Spotify needs to be asked.
+        """
+        current = self.current_track
+        if current is not None and current.id == track_id:
+            if current.is_playing == is_playing:
+                return current.is_liked
+        elif track_id in self._liked_cache:
+            self._liked_cache.move_to_end(track_id)
+            return self._liked_cache[track_id]
+        return None
+
+    def _remember_liked(self, track_id: str, *, track_liked: bool) -> None:
+        """
+        Remember whether a track is liked, forgetting the least recently used track if full.
+        """
+        self._liked_cache[track_id] = track_liked
+        self._liked_cache.move_to_end(track_id)
+        if len(self._liked_cache) > LIKED_CACHE_SIZE:
+            self._liked_cache.popitem(last=False)
+
+    def _ask_spotify_if_track_liked(self, track_id: str) -> bool | None:
         """
         Determine is Spotify believes the current track is liked.
+
+        Returns None if Spotify could not be asked.
         """
         try:
             logger.debug("Retrieving if track liked from Spotify")
             return self.sp.current_user_saved_tracks_contains([track_id])[0]
         except requests.exceptions.Timeout:
             logger.warning("Spotify call (current_user_saved_tracks_contains) timed out")
-            return False
+            return None
 
     def get_artist(self) -> str:
         """
@@ -8,9 +8,11 @@ Various utility functions.
 from __future__ import annotations
 
 import socket
+from typing import Final
 from unicodedata import combining, normalize
 
-import psutil
+# Any non-local address works; connecting a UDP socket sends no packets
+_ROUTE_PROBE_ADDR: Final = ("10.255.255.255", 1)
 
 
 def gethostname() -> str:
@@ -22,24 +24,42 @@ def gethostname() -> str:
 
 def net_addr() -> str:
     """
-    Retrieve the IPv4 address of the first non-loopback adapter.
+    Retrieve the IPv4 address of the adapter used for outgoing traffic.
+
+    The kernel picks the source address when a UDP socket is connected, so
+    the address is found without enumerating every interface.
 
     Returns empty string if none found.
     """
-    addresses = psutil.net_if_addrs()
-    for key, addresslist in addresses.items():
-        if key != "lo":
-            for addr in addresslist:
-                if addr.family == socket.AF_INET:
-                    return addr.address
-    return ""
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+        try:
+            sock.connect(_ROUTE_PROBE_ADDR)
+        except OSError:
+            return ""
+        return sock.getsockname()[0]
 
 
-def add_to_max(add1: int, add2: int, max_num: int) -> int:
+def wrap_buffer(string: str, length: int, wrap_pad: str = "") -> str:
     """
-    Add two numbers, and wrap to max_num.
+    Build the buffer used to wrap a string to a given length.
+
+    Strings which fit within length are returned unchanged. Longer strings are
+    padded and doubled, so that any wrapped substring is a single slice.
     """
-    return (add1 + add2) % max_num
+    if len(string) <= length:
+        return string
+    padded = string + wrap_pad
+    return padded + padded
+
+
+def wrap_slice(buffer: str, start: int, length: int) -> str:
+    """
+    Slice a buffer built by wrap_buffer, given a starting position and length.
+    """
+    if len(buffer) <= length:
+        return buffer
+    start %= len(buffer) // 2
+    return buffer[start:start + length]
 
 
 def substr_wrap(string: str, start: int, length: int, wrap_pad: str = "") -> str:
@@ -64,23 +84,54 @@ def substr_wrap(string: str, start: int, length: int, wrap_pad: str = "") -> str
     # prints 5 characters starting at position 7, wrapping when needed
 
     print(substr_wrap("0123456789", 8, 5, " "))
-    => 890 1
+    => 89 01
     # prints 5 characters starting at position 8, wrapping and padding as needed
     """
-    if len(string) <= length:
-        return string
-    string = string + wrap_pad
-    chrs = [string[add_to_max(start, i, len(string))] for i in range(length)]
-    return "".join(chrs)
+    return wrap_slice(wrap_buffer(string, length, wrap_pad), start, length)
+
+
+# Letters which Unicode decomposition doesn't reduce to a plain ASCII letter
+outliers: Final = str.maketrans({
+    "ä": "a", "æ": "ae", "ǽ": "ae", "đ": "d", "ð": "d", "ƒ": "f", "ħ": "h", "ı": "i",
+    "ł": "l", "ø": "o", "ǿ": "o", "ö": "o", "œ": "oe", "ß": "ss", "ŧ": "t", "þ": "th",
+    "ü": "u",
+    "Ä": "A", "Æ": "AE", "Ǽ": "AE", "Đ": "D", "Ð": "D", "Ƒ": "F", "Ħ": "H",
+    "Ł": "L", "Ø": "O", "Ǿ": "O", "Ö": "O", "Œ": "OE", "ẞ": "SS", "Ŧ": "T", "Þ": "TH",
+    "Ü": "U",
+})
+
 
+def _fold_diacritics(s: str) -> str:
+    """
+    Remove diacritics from any string, using Unicode decomposition.
+    """
+    return "".join([c for c in normalize("NFD", s.translate(outliers)) if not combining(c)])
 
-LATIN = "ä æ  ǽ  đ ð ƒ ħ ı ł ø ǿ ö œ  ß  ŧ þ  ü Ä Æ  Ǽ  Đ Ð Ƒ Ħ I Ł Ø Ǿ Ö Œ  ẞ  Ŧ Þ  Ü"
-ASCII = "a ae ae d d f h i l o o o oe ss t th u A AE AE D D F H I L O O O OE SS T TH U"
-outliers = str.maketrans(dict(zip(LATIN.split(), ASCII.split())))
+
+# Folding works one character at a time (combining marks fold to nothing), so every
+# character from Latin-1 Supplement up to the end of Combining Diacritical Marks can
+# be folded once, into a translation table. Characters which fold to themselves
+# are left out.
+FOLD_TABLE_LIMIT: Final = "\u036f"
+fold_table: Final = str.maketrans({
+    char: folded
+    for char, folded in (
+        (chr(cp), _fold_diacritics(chr(cp))) for cp in range(0x80, ord(FOLD_TABLE_LIMIT) + 1)
+    )
+    if folded != char
+})
 
 
 def remove_diacritics(s: str) -> str:
     """
     Remove diacritics from the provided string.
+
+    ASCII strings are returned unchanged. Strings within Latin Extended-B and the
+    combining diacritical marks take a single translate() pass; anything beyond
+    falls back to Unicode decomposition.
     """
-    return "".join(c for c in normalize("NFD", s.translate(outliers)) if not combining(c))
+    if s.isascii():
+        return s
+    if max(s) <= FOLD_TABLE_LIMIT:
+        return s.translate(fold_table)
+    return _fold_diacritics(s)